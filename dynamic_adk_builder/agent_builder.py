@@ -1,5 +1,8 @@
 import logging
-from typing import Any, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional, Union
 
 from google.adk.agents.llm_agent import Agent
 from .sub_agents_builder import SubAgentsBuilder
@@ -7,28 +10,31 @@ from .tools_builder import ToolsBuilder
 
 logger = logging.getLogger(__name__)
 
+_EMPTY = ()
+
 
 class AgentBuilder:
     
     def __init__(self, model: Any, name: str, description: str, instruction: str,
-                 registry_path: str = None):
+                 registry_path: Optional[Union[str, os.PathLike]] = None):
         self.model = model
         self.name = name
         self.description = description
         self.instruction = instruction
-        self.registry_path = registry_path
+        self.registry_path = Path(registry_path).resolve() if registry_path else None
     
     def build(self) -> Agent:
         try:
-            sub_agents = []
-            if self.registry_path:
+            sub_agents = _EMPTY
+            tools = _EMPTY
+            if self.registry_path is not None:
                 sub_agents_builder = SubAgentsBuilder(self.registry_path)
-                sub_agents = sub_agents_builder.build()
-            
-            tools = []
-            if self.registry_path:
                 tools_builder = ToolsBuilder(self.registry_path)
-                tools = tools_builder.build()
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    sub_agents_future = executor.submit(sub_agents_builder.build)
+                    tools_future = executor.submit(tools_builder.build)
+                    sub_agents = sub_agents_future.result()
+                    tools = tools_future.result()
             
             agent = Agent(
                 model=self.model,
@@ -39,7 +45,7 @@ class AgentBuilder:
                 sub_agents=sub_agents
             )
             
-            logger.info(f"Successfully built agent '{self.name}' with {len(sub_agents)} sub-agent(s) and {len(tools)} tool(s)")
+            logger.info("Successfully built agent '%s' with %d sub-agent(s) and %d tool(s)", self.name, len(sub_agents), len(tools))
             return agent
             
         except Exception as e:
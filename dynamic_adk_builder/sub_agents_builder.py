@@ -1,5 +1,7 @@
+import functools
 import logging
-from typing import List
+import os
+from typing import Tuple, Union
 
 from google.adk.agents.llm_agent import Agent
 from dynamic_adk_registry import SubAgentRegistry, AgentLoadError, ConfigurationError
@@ -7,17 +9,24 @@ from dynamic_adk_registry import SubAgentRegistry, AgentLoadError, Configuration
 logger = logging.getLogger(__name__)
 
 
+# Registries re-stat their file on every parse, so one instance per path
+# stays current across edits.
+@functools.lru_cache(maxsize=32)
+def _get_sub_agent_registry(registry_path: str) -> SubAgentRegistry:
+    return SubAgentRegistry(registry_path)
+
+
 class SubAgentsBuilder:
     
-    def __init__(self, registry_path: str):
+    def __init__(self, registry_path: Union[str, os.PathLike]):
         self.registry_path = registry_path
         self._registry = None
     
-    def build(self) -> List[Agent]:
+    def build(self) -> Tuple[Agent, ...]:
         try:
-            self._registry = SubAgentRegistry(self.registry_path)
-            sub_agents = self._registry.load_agents()
-            logger.info(f"Loaded {len(sub_agents)} sub-agent(s) from registry")
+            self._registry = _get_sub_agent_registry(os.fspath(self.registry_path))
+            sub_agents = tuple(self._registry.load_agents())
+            logger.info("Loaded %d sub-agent(s) from registry", len(sub_agents))
             return sub_agents
         except (ConfigurationError, AgentLoadError) as e:
             logger.error("Failed to build sub-agents from registry: %s", e)
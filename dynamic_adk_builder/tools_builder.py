@@ -1,22 +1,31 @@
+import functools
 import logging
-from typing import List, Any
+import os
+from typing import Any, Tuple, Union
 
 from dynamic_adk_registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
 
+# Registries re-stat their file on every parse, so one instance per path
+# stays current across edits.
+@functools.lru_cache(maxsize=32)
+def _get_tool_registry(registry_path: str) -> ToolRegistry:
+    return ToolRegistry(registry_path)
+
+
 class ToolsBuilder:
     
-    def __init__(self, registry_path: str):
+    def __init__(self, registry_path: Union[str, os.PathLike]):
         self.registry_path = registry_path
         self._registry = None
     
-    def build(self) -> List[Any]:
+    def build(self) -> Tuple[Any, ...]:
         try:
-            self._registry = ToolRegistry(self.registry_path)
-            tools = self._registry.load_tools()
-            logger.info(f"Loaded {len(tools)} tool(s) from registry")
+            self._registry = _get_tool_registry(os.fspath(self.registry_path))
+            tools = tuple(self._registry.load_tools())
+            logger.info("Loaded %d tool(s) from registry", len(tools))
             return tools
         except Exception as e:
             logger.error("Failed to load tools from registry: %s", e)
@@ -14,6 +14,10 @@ Usage:
     # Load tools
     tool_registry = ToolRegistry('path/to/tools_registry.yaml')
     tools = tool_registry.load_tools()
+
+Agent modules can declare which attribute holds their agent with a module-level
+``__agent__ = "my_agent"``. The loader then reads that attribute directly instead
+of scanning the module namespace for Agent instances.
 """
 
 from .sub_agents.registry import SubAgentRegistry
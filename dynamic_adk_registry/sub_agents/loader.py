@@ -1,20 +1,29 @@
-import importlib
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 from google.adk.agents.llm_agent import Agent
 
 from ..exceptions import AgentLoadError, AgentNotFoundError
+from ..utils import cached_import, enabled_in_order, get_callable
 
 logger = logging.getLogger(__name__)
 
+_EMPTY = ()
+
+
+def _is_complete_tool(tool_config: dict) -> bool:
+    return bool(tool_config.get('name') and tool_config.get('module') and tool_config.get('function'))
+
 
 class SubAgentLoader:
     
+    __slots__ = ()
+    
     @staticmethod
     def load_agent_from_module(module_path: str, agent_name: str, tools: list = None, sub_agents: list = None) -> Agent:
         try:
-            module = importlib.import_module(module_path)
+            module = cached_import(module_path)
         except ImportError as e:
             raise AgentNotFoundError(f"Failed to import module '{module_path}' for agent '{agent_name}': {e}")
         except Exception as e:
@@ -29,31 +38,53 @@ class SubAgentLoader:
             loaded_sub_agents = SubAgentLoader.load_sub_agents_for_agent(sub_agents, agent_name)
         
         agent = SubAgentLoader.discover_agent(module, agent_name, module_path, loaded_tools, loaded_sub_agents)
-        logger.info(f"Loaded agent '{agent_name}' from '{module_path}' with {len(loaded_tools)} tool(s) and {len(loaded_sub_agents)} sub-agent(s)")
+        logger.info("Loaded agent '%s' from '%s' with %d tool(s) and %d sub-agent(s)", agent_name, module_path, len(loaded_tools), len(loaded_sub_agents))
         
         return agent
     
     @staticmethod
     def discover_agent(module: Any, agent_name: str, module_path: str, tools: list = None, sub_agents: list = None) -> Agent:
-        if hasattr(module, agent_name):
-            candidate = getattr(module, agent_name)
-            if isinstance(candidate, Agent):
-                return SubAgentLoader._rebuild_agent_with_tools_and_sub_agents(candidate, tools, sub_agents) if (tools or sub_agents) else candidate
+        agent = SubAgentLoader._find_agent(module, agent_name, module_path)
+        if tools or sub_agents:
+            return SubAgentLoader._rebuild_agent_with_tools_and_sub_agents(agent, tools, sub_agents)
+        return agent
+    
+    @staticmethod
+    def _find_agent(module: Any, agent_name: str, module_path: str) -> Agent:
+        namespace = module.__dict__
+        
+        declared_name = namespace.get('__agent__')
+        if declared_name is not None:
+            candidate = namespace.get(declared_name)
+            if not isinstance(candidate, Agent):
+                raise AgentLoadError(
+                    f"Module '{module_path}' declares __agent__ = '{declared_name}', "
+                    f"but that attribute is not an Agent instance"
+                )
+            return candidate
+        
+        candidate = namespace.get(agent_name)
+        if isinstance(candidate, Agent):
+            return candidate
         
         agent_candidates = []
-        for attr_name in dir(module):
-            if attr_name.endswith('_agent') and not attr_name.startswith('_'):
-                candidate = getattr(module, attr_name)
+        fallback = None
+        for attr_name, candidate in namespace.items():
+            if attr_name[0] == '_':
+                continue
+            if attr_name.endswith('_agent'):
                 if isinstance(candidate, Agent):
                     agent_candidates.append((attr_name, candidate))
+            elif (fallback is None or attr_name < fallback) and isinstance(candidate, Agent):
+                # Keep the first name in sorted order, as the dir() scan did.
+                fallback = attr_name
         
         if len(agent_candidates) == 1:
-            attr_name, agent = agent_candidates[0]
-            return SubAgentLoader._rebuild_agent_with_tools_and_sub_agents(agent, tools, sub_agents) if (tools or sub_agents) else agent
+            return agent_candidates[0][1]
         elif len(agent_candidates) > 1:
             for attr_name, agent in agent_candidates:
-                if attr_name == agent_name or agent.name == agent_name:
-                    return SubAgentLoader._rebuild_agent_with_tools_and_sub_agents(agent, tools, sub_agents) if (tools or sub_agents) else agent
+                if agent.name == agent_name:
+                    return agent
             
             names = [name for name, _ in agent_candidates]
             raise AgentLoadError(
@@ -61,11 +92,8 @@ class SubAgentLoader:
                 f"Cannot determine which one to use for '{agent_name}'"
             )
         
-        for attr_name in dir(module):
-            if not attr_name.startswith('_'):
-                candidate = getattr(module, attr_name)
-                if isinstance(candidate, Agent):
-                    return SubAgentLoader._rebuild_agent_with_tools_and_sub_agents(candidate, tools, sub_agents) if (tools or sub_agents) else candidate
+        if fallback is not None:
+            return namespace[fallback]
         
         raise AgentLoadError(
             f"No Agent instance found in module '{module_path}' for agent '{agent_name}'. "
@@ -74,52 +102,60 @@ class SubAgentLoader:
     
     @staticmethod
     def load_tools_for_agent(tool_configs: list, agent_name: str) -> list:
-        from ..exceptions import ToolLoadError
+        enabled_tools = enabled_in_order(tool_configs)
+        
+        module_imports = SubAgentLoader._import_modules_concurrently({
+            config['module'] for config in enabled_tools
+            if _is_complete_tool(config)
+        })
         
-        enabled_tools = [
-            config for config in tool_configs
-            if config.get('enabled', False)
+        return [
+            tool for tool in (
+                SubAgentLoader._load_one_tool(tool_config, agent_name, module_imports)
+                for tool_config in enabled_tools
+            )
+            if tool is not None
         ]
-        enabled_tools.sort(key=lambda x: x.get('order', 999))
+    
+    @staticmethod
+    def _load_one_tool(tool_config: dict, agent_name: str, module_imports: dict) -> Optional[Callable]:
+        tool_name = tool_config.get('name')
+        module_path = tool_config.get('module')
+        function_name = tool_config.get('function')
         
-        loaded_tools = []
-        for tool_config in enabled_tools:
-            tool_name = tool_config.get('name')
-            module_path = tool_config.get('module')
-            function_name = tool_config.get('function')
+        if not _is_complete_tool(tool_config):
+            logger.warning("Skipping incomplete tool configuration for agent '%s': %s", agent_name, tool_config)
+            return None
+        
+        try:
+            future = module_imports.get(module_path)
+            tool_module = future.result() if future is not None else cached_import(module_path)
+            tool_function = get_callable(tool_module, module_path, function_name, AgentLoadError)
             
-            if not all([tool_name, module_path, function_name]):
-                logger.warning(f"Skipping incomplete tool configuration for agent '{agent_name}': {tool_config}")
-                continue
+            logger.info("Loaded tool '%s' (%s) from '%s' for agent '%s'", tool_name, function_name, module_path, agent_name)
+            return tool_function
             
-            try:
-                tool_module = importlib.import_module(module_path)
-                
-                if not hasattr(tool_module, function_name):
-                    raise AgentLoadError(f"Function '{function_name}' not found in module '{module_path}'")
-                
-                tool_function = getattr(tool_module, function_name)
-                
-                if callable(tool_function):
-                    loaded_tools.append(tool_function)
-                    logger.info(f"Loaded tool '{tool_name}' ({function_name}) from '{module_path}' for agent '{agent_name}'")
-                else:
-                    raise AgentLoadError(f"'{function_name}' in module '{module_path}' is not callable")
-                    
-            except ImportError as e:
-                raise AgentLoadError(f"Failed to import tool module '{module_path}' for agent '{agent_name}': {e}")
-            except Exception as e:
-                raise AgentLoadError(f"Failed to load tool '{tool_name}' for agent '{agent_name}': {e}")
+        except ImportError as e:
+            raise AgentLoadError(f"Failed to import tool module '{module_path}' for agent '{agent_name}': {e}")
+        except Exception as e:
+            raise AgentLoadError(f"Failed to load tool '{tool_name}' for agent '{agent_name}': {e}")
+    
+    @staticmethod
+    def _import_modules_concurrently(module_paths: set) -> dict:
+        # A single pending import is cheaper inline than through a pool;
+        # _load_one_tool imports anything missing from the result itself.
+        if len(module_paths) <= 1:
+            return {}
         
-        return loaded_tools
+        with ThreadPoolExecutor(max_workers=min(8, len(module_paths))) as executor:
+            return {
+                module_path: executor.submit(cached_import, module_path)
+                for module_path in module_paths
+            }
     
     @staticmethod
     def load_sub_agents_for_agent(sub_agent_configs: list, parent_agent_name: str) -> list:
-        enabled_sub_agents = [
-            config for config in sub_agent_configs
-            if config.get('enabled', False)
-        ]
-        enabled_sub_agents.sort(key=lambda x: x.get('order', 999))
+        enabled_sub_agents = enabled_in_order(sub_agent_configs)
         
         loaded_sub_agents = []
         for sub_agent_config in enabled_sub_agents:
@@ -129,7 +165,7 @@ class SubAgentLoader:
             nested_sub_agents = sub_agent_config.get('sub_agents', [])
             
             if not all([sub_agent_name, module_path]):
-                logger.warning(f"Skipping incomplete sub_agent configuration for agent '{parent_agent_name}': {sub_agent_config}")
+                logger.warning("Skipping incomplete sub_agent configuration for agent '%s': %s", parent_agent_name, sub_agent_config)
                 continue
             
             try:
@@ -140,7 +176,7 @@ class SubAgentLoader:
                     sub_agents=nested_sub_agents
                 )
                 loaded_sub_agents.append(sub_agent)
-                logger.info(f"Loaded sub_agent '{sub_agent_name}' from '{module_path}' for agent '{parent_agent_name}'")
+                logger.info("Loaded sub_agent '%s' from '%s' for agent '%s'", sub_agent_name, module_path, parent_agent_name)
                     
             except Exception as e:
                 raise AgentLoadError(f"Failed to load sub_agent '{sub_agent_name}' for agent '{parent_agent_name}': {e}")
@@ -149,8 +185,13 @@ class SubAgentLoader:
     
     @staticmethod
     def _rebuild_agent_with_tools_and_sub_agents(agent: Agent, tools: list = None, sub_agents: list = None) -> Agent:
-        final_tools = tools if tools is not None else (agent.tools if hasattr(agent, 'tools') else [])
-        final_sub_agents = sub_agents if sub_agents is not None else (agent.sub_agents if hasattr(agent, 'sub_agents') else [])
+        current_tools = getattr(agent, 'tools', None) or _EMPTY
+        current_sub_agents = getattr(agent, 'sub_agents', None) or _EMPTY
+        final_tools = tools if tools is not None else current_tools
+        final_sub_agents = sub_agents if sub_agents is not None else current_sub_agents
+        
+        if hasattr(agent, 'model_copy'):
+            return SubAgentLoader._copy_agent(agent, final_tools, final_sub_agents)
         
         return Agent(
             model=agent.model,
@@ -160,3 +201,19 @@ class SubAgentLoader:
             tools=final_tools,
             sub_agents=final_sub_agents
         )
+    
+    @staticmethod
+    def _copy_agent(agent: Agent, tools: list, sub_agents: list) -> Agent:
+        # model_copy skips pydantic validation, including the validator that
+        # links sub-agents to their parent, so do that wiring here.
+        for sub_agent in sub_agents:
+            if sub_agent.parent_agent is not None:
+                raise AgentLoadError(
+                    f"Agent '{sub_agent.name}' already has a parent agent "
+                    f"'{sub_agent.parent_agent.name}' and cannot be added to '{agent.name}'"
+                )
+        
+        copied = agent.model_copy(update={'tools': list(tools), 'sub_agents': list(sub_agents)})
+        for sub_agent in copied.sub_agents:
+            sub_agent.parent_agent = copied
+        return copied
@@ -1,31 +1,53 @@
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict
-
-import yaml
+from typing import Any, Dict, List, Optional
 
 from ..exceptions import ConfigurationError
+from ..utils import load_enabled, load_registry
 
 logger = logging.getLogger(__name__)
 
 
 class SubAgentYAMLParser:
     
+    __slots__ = ('config_path', 'file_exists')
+    
     def __init__(self, config_path: str):
         self.config_path = Path(config_path)
         self.file_exists = self.config_path.exists()
         if not self.file_exists:
-            logger.info(f"Configuration file not found: {config_path}. Sub-agents registration will be skipped.")
+            logger.info("Configuration file not found: %s. Sub-agents registration will be skipped.", config_path)
     
     def parse(self) -> Dict[str, Any]:
-        if not self.file_exists:
+        stat = self._stat()
+        if stat is None:
             return {'agents': []}
-        
+        return self._parse(stat)
+    
+    def enabled_agents(self) -> List[Dict[str, Any]]:
+        stat = self._stat()
+        if stat is None:
+            return []
+        self._parse(stat)
+        return load_enabled(self.config_path, 'agents', stat)
+    
+    def _stat(self) -> Optional[os.stat_result]:
+        # Re-stat on every call so edits to the file, or a file created
+        # after this parser, are picked up by long-lived parsers;
+        # load_registry caches on the mtime and size.
+        try:
+            return os.stat(self.config_path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise ConfigurationError(f"Error reading configuration file: {e}")
+    
+    def _parse(self, stat: os.stat_result) -> Dict[str, Any]:
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Failed to parse YAML file: {e}")
+            config = load_registry(self.config_path, stat)
+        except ConfigurationError:
+            raise
         except Exception as e:
             raise ConfigurationError(f"Error reading configuration file: {e}")
         
@@ -39,85 +61,68 @@ class SubAgentYAMLParser:
             raise ConfigurationError("'agents' must be a list")
         
         for agent_config in config['agents']:
-            if 'tools' in agent_config:
-                if not isinstance(agent_config['tools'], list):
-                    raise ConfigurationError(
-                        f"'tools' for agent '{agent_config.get('name', 'unknown')}' must be a list"
-                    )
-                self._validate_agent_tools(agent_config['tools'], agent_config.get('name', 'unknown'))
+            if 'tools' not in agent_config:
+                continue
+            tools = agent_config['tools']
+            agent_name = agent_config.get('name', 'unknown')
+            if not isinstance(tools, list):
+                raise ConfigurationError(f"'tools' for agent '{agent_name}' must be a list")
+            self._validate_agent_tools(tools, agent_name)
         
         self._validate_agents(config['agents'])
         
         return config
     
     def _validate_agents(self, agents: list) -> None:
-        self._validate_duplicate_name_module(agents)
-        self._validate_duplicate_order(agents)
-    
-    def _validate_duplicate_name_module(self, agents: list) -> None:
         seen = {}
+        order_map = {}
         for idx, agent in enumerate(agents):
             name = agent.get('name')
             module = agent.get('module')
             
-            if not name or not module:
-                continue
+            if name and module:
+                key = (name, module)
+                if key in seen:
+                    raise ConfigurationError(
+                        f"Duplicate agent configuration found: agent '{name}' "
+                        f"with module '{module}' is defined at positions {seen[key]} and {idx}"
+                    )
+                seen[key] = idx
             
-            key = (name, module)
-            if key in seen:
-                raise ConfigurationError(
-                    f"Duplicate agent configuration found: agent '{name}' "
-                    f"with module '{module}' is defined at positions {seen[key]} and {idx}"
-                )
-            seen[key] = idx
-    
-    def _validate_duplicate_order(self, agents: list) -> None:
-        enabled_agents = [
-            agent for agent in agents 
-            if agent.get('enabled', False)
-        ]
-        
-        order_map = {}
-        for agent in enabled_agents:
             order = agent.get('order')
-            name = agent.get('name', 'unknown')
-            
-            if order is None:
+            if order is None or not agent.get('enabled', False):
                 continue
             
+            display_name = 'unknown' if name is None else name
             if order in order_map:
                 raise ConfigurationError(
                     f"Duplicate order value {order} found for enabled agents: "
-                    f"'{order_map[order]}' and '{name}'"
+                    f"'{order_map[order]}' and '{display_name}'"
                 )
-            order_map[order] = name
+            order_map[order] = display_name
     
     def _validate_agent_tools(self, tools: list, agent_name: str) -> None:
         seen_names = {}
+        order_map = {}
         for idx, tool in enumerate(tools):
             name = tool.get('name')
-            if not name:
-                continue
             
-            if name in seen_names:
-                raise ConfigurationError(
-                    f"Duplicate tool name '{name}' found in agent '{agent_name}' "
-                    f"at positions {seen_names[name]} and {idx}"
-                )
-            seen_names[name] = idx
-        
-        enabled_tools = [tool for tool in tools if tool.get('enabled', False)]
-        order_map = {}
-        for tool in enabled_tools:
-            order = tool.get('order')
-            name = tool.get('name', 'unknown')
+            if name:
+                if name in seen_names:
+                    raise ConfigurationError(
+                        f"Duplicate tool name '{name}' found in agent '{agent_name}' "
+                        f"at positions {seen_names[name]} and {idx}"
+                    )
+                seen_names[name] = idx
             
-            if order is None:
+            order = tool.get('order')
+            if order is None or not tool.get('enabled', False):
                 continue
             
+            display_name = 'unknown' if name is None else name
             if order in order_map:
                 raise ConfigurationError(
                     f"Duplicate order value {order} found for enabled tools in agent '{agent_name}': "
-                    f"'{order_map[order]}' and '{name}'"
+                    f"'{order_map[order]}' and '{display_name}'"
                 )
-            order_map[order] = name
+            order_map[order] = display_name
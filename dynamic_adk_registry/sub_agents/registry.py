@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from google.adk.agents.llm_agent import Agent
@@ -9,36 +10,38 @@ from .parser import SubAgentYAMLParser
 
 logger = logging.getLogger(__name__)
 
+# The loader is stateless, so every registry can share one instance.
+_LOADER = SubAgentLoader()
+
 
 class SubAgentRegistry:
     
+    __slots__ = ('config_path', 'parser', 'loader')
+    
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.parser = SubAgentYAMLParser(config_path)
-        self.loader = SubAgentLoader()
+        self.loader = _LOADER
     
     def load_agents(self) -> List[Agent]:
-        config = self.parser.parse()
-        agent_configs = config.get('agents', [])
+        enabled_configs = self.parser.enabled_agents()
         
-        enabled_configs = [
-            config for config in agent_configs 
-            if config.get('enabled', False)
-        ]
-        enabled_configs.sort(key=lambda x: x.get('order', 999))
+        if len(enabled_configs) <= 1:
+            return [self._load_agent(config) for config in enabled_configs]
         
-        loaded_agents = []
-        for config in enabled_configs:
-            agent_name = config['name']
-            module_path = config['module']
-            tools = config.get('tools', [])
-            sub_agents = config.get('sub_agents', [])
-            
-            try:
-                agent = self.loader.load_agent_from_module(module_path, agent_name, tools, sub_agents)
-                loaded_agents.append(agent)
-            except (AgentLoadError, Exception) as e:
-                logger.error(f"Failed to load agent '{agent_name}' from '{module_path}': {e}")
-                raise AgentLoadError(f"Failed to load agent '{agent_name}' from '{module_path}': {e}") from e
+        with ThreadPoolExecutor(max_workers=min(8, len(enabled_configs))) as executor:
+            return list(executor.map(self._load_agent, enabled_configs))
+    
+    def _load_agent(self, config: dict) -> Agent:
+        agent_name = config['name']
+        module_path = config['module']
+        tools = config.get('tools', [])
+        sub_agents = config.get('sub_agents', [])
         
-        return loaded_agents
+        try:
+            return self.loader.load_agent_from_module(module_path, agent_name, tools, sub_agents)
+        except Exception as e:
+            logger.error("Failed to load agent '%s' from '%s': %s", agent_name, module_path, e)
+            if isinstance(e, AgentLoadError):
+                raise
+            raise AgentLoadError(f"Failed to load agent '{agent_name}' from '{module_path}': {e}") from e
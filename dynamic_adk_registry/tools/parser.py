@@ -1,31 +1,53 @@
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict
-
-import yaml
+from typing import Any, Dict, List, Optional
 
 from ..exceptions import ConfigurationError
+from ..utils import load_enabled, load_registry
 
 logger = logging.getLogger(__name__)
 
 
 class ToolYAMLParser:
     
+    __slots__ = ('config_path', 'file_exists')
+    
     def __init__(self, config_path: str):
         self.config_path = Path(config_path)
         self.file_exists = self.config_path.exists()
         if not self.file_exists:
-            logger.info(f"Configuration file not found: {config_path}. Tools registration will be skipped.")
+            logger.info("Configuration file not found: %s. Tools registration will be skipped.", config_path)
     
     def parse(self) -> Dict[str, Any]:
-        if not self.file_exists:
+        stat = self._stat()
+        if stat is None:
             return {'tools': []}
-        
+        return self._parse(stat)
+    
+    def enabled_tools(self) -> List[Dict[str, Any]]:
+        stat = self._stat()
+        if stat is None:
+            return []
+        self._parse(stat)
+        return load_enabled(self.config_path, 'tools', stat)
+    
+    def _stat(self) -> Optional[os.stat_result]:
+        # Re-stat on every call so edits to the file, or a file created
+        # after this parser, are picked up by long-lived parsers;
+        # load_registry caches on the mtime and size.
+        try:
+            return os.stat(self.config_path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise ConfigurationError(f"Error reading configuration file: {e}")
+    
+    def _parse(self, stat: os.stat_result) -> Dict[str, Any]:
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ConfigurationError(f"Failed to parse YAML file: {e}")
+            config = load_registry(self.config_path, stat)
+        except ConfigurationError:
+            raise
         except Exception as e:
             raise ConfigurationError(f"Error reading configuration file: {e}")
         
@@ -43,43 +65,29 @@ class ToolYAMLParser:
         return config
     
     def _validate_tools(self, tools: list) -> None:
-        self._validate_duplicate_name_module(tools)
-        self._validate_duplicate_order(tools)
-    
-    def _validate_duplicate_name_module(self, tools: list) -> None:
         seen = {}
+        order_map = {}
         for idx, tool in enumerate(tools):
             name = tool.get('name')
             module = tool.get('module')
             
-            if not name or not module:
-                continue
+            if name and module:
+                key = (name, module)
+                if key in seen:
+                    raise ConfigurationError(
+                        f"Duplicate tool configuration found: tool '{name}' "
+                        f"with module '{module}' is defined at positions {seen[key]} and {idx}"
+                    )
+                seen[key] = idx
             
-            key = (name, module)
-            if key in seen:
-                raise ConfigurationError(
-                    f"Duplicate tool configuration found: tool '{name}' "
-                    f"with module '{module}' is defined at positions {seen[key]} and {idx}"
-                )
-            seen[key] = idx
-    
-    def _validate_duplicate_order(self, tools: list) -> None:
-        enabled_tools = [
-            tool for tool in tools 
-            if tool.get('enabled', False)
-        ]
-        
-        order_map = {}
-        for tool in enabled_tools:
             order = tool.get('order')
-            name = tool.get('name', 'unknown')
-            
-            if order is None:
+            if order is None or not tool.get('enabled', False):
                 continue
             
+            display_name = 'unknown' if name is None else name
             if order in order_map:
                 raise ConfigurationError(
                     f"Duplicate order value {order} found for enabled tools: "
-                    f"'{order_map[order]}' and '{name}'"
+                    f"'{order_map[order]}' and '{display_name}'"
                 )
-            order_map[order] = name
+            order_map[order] = display_name
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Any
 
 from .loader import ToolLoader
@@ -7,35 +8,37 @@ from .parser import ToolYAMLParser
 
 logger = logging.getLogger(__name__)
 
+# The loader is stateless, so every registry can share one instance.
+_LOADER = ToolLoader()
+
 
 class ToolRegistry:
     
+    __slots__ = ('config_path', 'parser', 'loader')
+    
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.parser = ToolYAMLParser(config_path)
-        self.loader = ToolLoader()
+        self.loader = _LOADER
     
     def load_tools(self) -> List[Any]:
-        config = self.parser.parse()
-        tool_configs = config.get('tools', [])
+        enabled_configs = self.parser.enabled_tools()
         
-        enabled_configs = [
-            config for config in tool_configs 
-            if config.get('enabled', False)
-        ]
-        enabled_configs.sort(key=lambda x: x.get('order', 999))
+        if len(enabled_configs) <= 1:
+            return [self._load_tool(config) for config in enabled_configs]
         
-        loaded_tools = []
-        for config in enabled_configs:
-            tool_name = config['name']
-            module_path = config['module']
-            function_name = config['function']
-            
-            try:
-                tool = self.loader.load_tool_from_module(module_path, function_name)
-                loaded_tools.append(tool)
-            except (ToolLoadError, Exception) as e:
-                logger.error(f"Failed to load tool '{tool_name}' from '{module_path}.{function_name}': {e}")
-                raise ToolLoadError(f"Failed to load tool '{tool_name}' from '{module_path}.{function_name}': {e}") from e
+        with ThreadPoolExecutor(max_workers=min(8, len(enabled_configs))) as executor:
+            return list(executor.map(self._load_tool, enabled_configs))
+    
+    def _load_tool(self, config: dict) -> Any:
+        tool_name = config['name']
+        module_path = config['module']
+        function_name = config['function']
         
-        return loaded_tools
+        try:
+            return self.loader.load_tool_from_module(module_path, function_name)
+        except Exception as e:
+            logger.error("Failed to load tool '%s' from '%s.%s': %s", tool_name, module_path, function_name, e)
+            if isinstance(e, ToolLoadError):
+                raise
+            raise ToolLoadError(f"Failed to load tool '{tool_name}' from '{module_path}.{function_name}': {e}") from e
@@ -0,0 +1,90 @@
+"""Shared helpers for the registry parsers and loaders."""
+
+import functools
+import importlib
+import json
+import os
+import threading
+from operator import methodcaller
+from typing import Any, Callable, List, Optional, Type
+
+from .exceptions import ConfigurationError
+
+_MISSING = object()
+
+_is_enabled = methodcaller('get', 'enabled', False)
+_order_of = methodcaller('get', 'order', 999)
+
+# The sub-agent and tool builders parse the same registry file in parallel;
+# serialize loads so the second caller gets the first one's cached result.
+_load_lock = threading.Lock()
+
+
+def cached_import(module_path: str) -> Any:
+    # import_module returns sys.modules entries itself, and takes the import
+    # lock first, so a module still initializing on another thread is waited
+    # for rather than handed back half-built.
+    return importlib.import_module(module_path)
+
+
+def get_callable(module: Any, module_path: str, function_name: str, error_cls: Type[Exception]) -> Callable:
+    function = getattr(module, function_name, _MISSING)
+    if function is _MISSING:
+        raise error_cls(f"Function '{function_name}' not found in module '{module_path}'")
+    
+    if not callable(function):
+        raise error_cls(f"'{function_name}' in module '{module_path}' is not callable")
+    
+    return function
+
+
+def enabled_in_order(configs: list) -> List[dict]:
+    # list.sort is stable, so equal orders keep their configuration order.
+    enabled = list(filter(_is_enabled, configs))
+    enabled.sort(key=_order_of)
+    return enabled
+
+
+def load_registry(path: str, stat: Optional[os.stat_result] = None) -> Any:
+    if stat is None:
+        stat = os.stat(path)
+    with _load_lock:
+        return _load_registry(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def load_enabled(path: str, section: str, stat: Optional[os.stat_result] = None) -> List[dict]:
+    # Filtered and sorted once per file version, under load_registry's key.
+    if stat is None:
+        stat = os.stat(path)
+    with _load_lock:
+        return _load_enabled(os.fspath(path), stat.st_mtime_ns, stat.st_size, section)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_enabled(path: str, mtime_ns: int, size: int, section: str) -> List[dict]:
+    return enabled_in_order(_load_registry(path, mtime_ns, size)[section])
+
+
+@functools.lru_cache(maxsize=64)
+def _load_registry(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, 'rb') as f:
+        if path.endswith('.json'):
+            try:
+                return json.load(f)
+            except json.JSONDecodeError as e:
+                raise ConfigurationError(f"Failed to parse JSON file: {e}")
+        
+        import yaml
+        try:
+            return yaml.load(f, Loader=_yaml_loader())
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"Failed to parse YAML file: {e}")
+
+
+@functools.cache
+def _yaml_loader() -> Any:
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
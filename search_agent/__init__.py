@@ -1,3 +1,12 @@
-from .agent import root_agent
+import importlib
 
 __all__ = ["root_agent"]
+
+
+# Building root_agent imports ADK and LiteLlm, so defer it until the agent
+# is actually requested; importing search_agent.config stays lightweight.
+def __getattr__(name):
+    if name in ("agent", "root_agent"):
+        module = importlib.import_module(".agent", __name__)
+        return module if name == "agent" else module.root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -32,7 +32,7 @@ agent_builder = AgentBuilder(
     name=config.agent_name,
     description=config.agent_description,
     instruction=config.agent_instruction,
-    registry_path=str(registry_path)
+    registry_path=registry_path
 )
 
 root_agent = agent_builder.build()
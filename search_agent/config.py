@@ -1,29 +1,44 @@
 import os
 import configparser
+import functools
+import logging
+import threading
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 
+_CONFIG_DIR = Path(__file__).parent
+_DEFAULT_ENV_PATH = _CONFIG_DIR / ".env"
+_DEFAULT_INI_PATH = _CONFIG_DIR / "config.ini"
+
+_EMPTY_SECTION: dict = {}
+
 
 class ConfigurationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _load_dotenv_once(env_path: Path) -> None:
+    load_dotenv(dotenv_path=env_path)
+
+
 class Config:
     
     def __init__(self, config_file: Optional[str] = None):
-        env_path = Path(__file__).parent / ".env"
-        load_dotenv(dotenv_path=env_path)
+        _load_dotenv_once(_DEFAULT_ENV_PATH)
         
         self.config = configparser.RawConfigParser()
         
         if config_file is None:
-            config_file = Path(__file__).parent / "config.ini"
+            config_file = _DEFAULT_INI_PATH
         
         self.config_file = Path(config_file)
         
-        if self.config_file.exists():
-            self.config.read(self.config_file)
+        # read() skips files it cannot open, so no separate exists() check.
+        self.config.read(self.config_file)
+        
+        self._ini = {section: dict(self.config.items(section)) for section in self.config.sections()}
     
     def _get_value(
         self, 
@@ -37,8 +52,9 @@ class Config:
             if value:
                 return value
         
-        if self.config.has_option(section, key):
-            return self.config.get(section, key)
+        value = self._ini.get(section, _EMPTY_SECTION).get(key)
+        if value is not None:
+            return value
         
         if required:
             raise ConfigurationError(
@@ -48,44 +64,51 @@ class Config:
         
         return None
     
-    @property
+    @functools.cached_property
     def openrouter_api_key(self) -> str:
         value = self._get_value("api", "openrouter_api_key", env_var="OPENROUTER_API_KEY", required=True)
         return value
     
-    @property
+    @functools.cached_property
     def api_base(self) -> str:
         return self._get_value("api", "api_base", env_var="OPENROUTER_API_BASE")
     
-    @property
+    @functools.cached_property
     def model_name(self) -> str:
         return self._get_value("api", "model_name", env_var="MODEL_NAME")
     
-    @property
+    @functools.cached_property
     def agent_name(self) -> str:
         return self._get_value("agent", "name")
     
-    @property
+    @functools.cached_property
     def agent_description(self) -> str:
         return self._get_value("agent", "description")
     
-    @property
+    @functools.cached_property
     def agent_instruction(self) -> str:
         return self._get_value("agent", "instruction")
     
-    @property
+    @functools.cached_property
     def log_level(self) -> str:
         return self._get_value("logging", "level", env_var="LOG_LEVEL").upper()
     
-    @property
+    @functools.cached_property
+    def log_level_num(self) -> int:
+        level = logging.getLevelNamesMapping().get(self.log_level)
+        if level is None:
+            raise ConfigurationError(f"Invalid logging level: {self.log_level}")
+        return level
+    
+    @functools.cached_property
     def log_format(self) -> str:
         return self._get_value("logging", "format")
     
-    @property
+    @functools.cached_property
     def log_date_format(self) -> str:
         return self._get_value("logging", "date_format")
     
-    @property
+    @functools.cached_property
     def registry_path(self) -> str:
         return self._get_value("registry", "registry_path")
 
@@ -94,10 +117,13 @@ class Config:
 
 
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
     global _config
     if _config is None:
-        _config = Config()
+        with _config_lock:
+            if _config is None:
+                _config = Config()
     return _config
@@ -1,11 +1,26 @@
 """Summarizing Agent Module - Provides content summarization capabilities."""
 
+import importlib
+
 from .summarizing_agent import summarize_content, summarizing_agent
-from .sub_agents.french_translator import french_translator_agent, translate_to_french
+
+# The French translator is registered as its own sub-agent, so it is only
+# imported (and its model built) when accessed through this package.
+_LAZY_EXPORTS = {
+    "french_translator_agent": ".sub_agents.french_translator",
+    "translate_to_french": ".sub_agents.french_translator",
+}
 
 __all__ = [
-    "summarize_content", 
-    "summarizing_agent", 
+    "summarize_content",
+    "summarizing_agent",
     "french_translator_agent",
     "translate_to_french"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 import os
 import configparser
+import functools
 from pathlib import Path
 from typing import Optional
 
@@ -33,39 +34,39 @@ class SummarizingConfig:
         
         return ""
     
-    @property
+    @functools.cached_property
     def model_name(self) -> str:
         return self._get_value("model", "model_name", env_var="SUMMARIZING_MODEL_NAME")
     
-    @property
+    @functools.cached_property
     def api_key(self) -> str:
         api_key = os.environ.get("OPENROUTER_API_KEY")
         if not api_key:
             raise ValueError("OPENROUTER_API_KEY environment variable is required")
         return api_key
     
-    @property
+    @functools.cached_property
     def api_base(self) -> str:
         return self._get_value("model", "api_base", env_var="SUMMARIZING_API_BASE")
     
-    @property
+    @functools.cached_property
     def agent_name(self) -> str:
         return self._get_value("agent", "name")
     
-    @property
+    @functools.cached_property
     def agent_description(self) -> str:
         return self._get_value("agent", "description")
     
-    @property
+    @functools.cached_property
     def agent_instruction(self) -> str:
         return self._get_value("agent", "instruction")
     
-    @property
+    @functools.cached_property
     def min_bullet_points(self) -> int:
         min_str = self._get_value("summarizing", "min_bullet_points", env_var="SUMMARIZING_MIN_BULLETS")
         return int(min_str)
     
-    @property
+    @functools.cached_property
     def max_bullet_points(self) -> int:
         max_str = self._get_value("summarizing", "max_bullet_points", env_var="SUMMARIZING_MAX_BULLETS")
         return int(max_str)
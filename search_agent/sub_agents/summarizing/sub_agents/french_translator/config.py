@@ -1,5 +1,6 @@
 import os
 import configparser
+import functools
 from pathlib import Path
 from typing import Optional
 
@@ -33,38 +34,38 @@ class FrenchTranslatorConfig:
         
         return ""
     
-    @property
+    @functools.cached_property
     def model_name(self) -> str:
         return self._get_value("model", "model_name", env_var="FRENCH_TRANSLATOR_MODEL_NAME")
     
-    @property
+    @functools.cached_property
     def api_key(self) -> str:
         api_key = os.environ.get("OPENROUTER_API_KEY")
         if not api_key:
             raise ValueError("OPENROUTER_API_KEY environment variable is required")
         return api_key
     
-    @property
+    @functools.cached_property
     def api_base(self) -> str:
         return self._get_value("model", "api_base", env_var="FRENCH_TRANSLATOR_API_BASE")
     
-    @property
+    @functools.cached_property
     def agent_name(self) -> str:
         return self._get_value("agent", "name")
     
-    @property
+    @functools.cached_property
     def agent_description(self) -> str:
         return self._get_value("agent", "description")
     
-    @property
+    @functools.cached_property
     def agent_instruction(self) -> str:
         return self._get_value("agent", "instruction")
     
-    @property
+    @functools.cached_property
     def target_language(self) -> str:
         return self._get_value("translation", "target_language", env_var="TRANSLATION_TARGET_LANGUAGE")
     
-    @property
+    @functools.cached_property
     def preserve_formatting(self) -> bool:
         preserve_str = self._get_value("translation", "preserve_formatting", env_var="TRANSLATION_PRESERVE_FORMATTING")
         return preserve_str.lower() in ("true", "1", "yes")
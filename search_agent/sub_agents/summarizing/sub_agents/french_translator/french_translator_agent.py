@@ -8,6 +8,8 @@ from google.adk.models.lite_llm import LiteLlm
 
 from .config import get_french_translator_config
 
+__agent__ = "french_translator_agent"
+
 try:
     config = get_french_translator_config()
 except Exception as e:
@@ -8,6 +8,8 @@ from google.adk.models.lite_llm import LiteLlm
 
 from .config import get_summarizing_config
 
+__agent__ = "summarizing_agent"
+
 try:
     config = get_summarizing_config()
 except Exception as e:
@@ -8,6 +8,8 @@ from google.adk.models.lite_llm import LiteLlm
 
 from .config import get_verifying_config
 
+__agent__ = "verifying_agent"
+
 try:
     config = get_verifying_config()
 except Exception as e:
@@ -1,5 +1,6 @@
 import os
 import configparser
+import functools
 from pathlib import Path
 from typing import Optional
 
@@ -33,34 +34,34 @@ class WikipediaConfig:
         
         return ""
     
-    @property
+    @functools.cached_property
     def model_name(self) -> str:
         return self._get_value("model", "model_name", env_var="WIKIPEDIA_MODEL_NAME")
     
-    @property
+    @functools.cached_property
     def api_key(self) -> str:
         api_key = os.environ.get("OPENROUTER_API_KEY")
         if not api_key:
             raise ValueError("OPENROUTER_API_KEY environment variable is required")
         return api_key
     
-    @property
+    @functools.cached_property
     def api_base(self) -> str:
         return self._get_value("model", "api_base", env_var="WIKIPEDIA_API_BASE")
     
-    @property
+    @functools.cached_property
     def agent_name(self) -> str:
         return self._get_value("agent", "name")
     
-    @property
+    @functools.cached_property
     def agent_description(self) -> str:
         return self._get_value("agent", "description")
     
-    @property
+    @functools.cached_property
     def agent_instruction(self) -> str:
         return self._get_value("agent", "instruction")
     
-    @property
+    @functools.cached_property
     def wikipedia_sentences(self) -> int:
         sentences_str = self._get_value("wikipedia", "sentences", env_var="WIKIPEDIA_SENTENCES")
         return int(sentences_str)
@@ -7,6 +7,8 @@ from google.adk.models.lite_llm import LiteLlm
 
 from .config import get_wikipedia_config
 
+__agent__ = "wikipedia_agent"
+
 
 # Set up logging
 logger = logging.getLogger(__name__)
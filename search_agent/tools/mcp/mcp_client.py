@@ -1,7 +1,6 @@
 """MCP Client."""
 
 import logging
-from typing import Optional
 
 from google.adk.tools.mcp_tool.mcp_toolset import McpToolset, StdioConnectionParams, StdioServerParameters
 
@@ -1,36 +1,67 @@
 """Logging setup utility for search agent."""
 
+import atexit
 import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
+_LOGS_DIR = Path(__file__).parent.parent / "logs"
+
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(config) -> logging.Logger:
     """
     Configure and setup logging for the search agent.
     
+    Only the first call configures handlers; later calls return the
+    same logger without opening another log file.
+    
     Args:
         config: Configuration object containing log settings
         
     Returns:
         Configured logger instance
     """
-    logs_dir = Path(__file__).parent.parent / "logs"
+    global _listener
+    if _listener is not None:
+        return logging.getLogger(__name__)
+    
+    logs_dir = _LOGS_DIR
     logs_dir.mkdir(exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     log_filename = logs_dir / f"search_agent_{timestamp}.log"
     
+    formatter = logging.Formatter(config.log_format, config.log_date_format)
+    file_handler = logging.FileHandler(log_filename, mode='a', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    # Records are handed to a background listener so file and console
+    # writes never block the thread that logged them. The queue handler
+    # only merges the message arguments; the listener's handlers apply
+    # the configured format.
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter())
+    _listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    _listener.start()
+    
     logging.basicConfig(
-        level=getattr(logging, config.log_level),
-        format=config.log_format,
-        datefmt=config.log_date_format,
+        level=config.log_level_num,
         force=True,
-        handlers=[
-            logging.FileHandler(log_filename, mode='a', encoding='utf-8'),
-            logging.StreamHandler()
-        ]
+        handlers=[queue_handler]
     )
     
     return logging.getLogger(__name__)
+
+
+@atexit.register
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()